@@ -1,98 +1,172 @@
 from __future__ import annotations
 
 import enum
+import functools
 import inspect
 import typing
 from dataclasses import dataclass
 from types import NoneType
-from typing import Any, ClassVar, Optional, Type, TypeAlias, Union
+from typing import Any, Callable, ClassVar, Optional, Type, TypeAlias, Union
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+# Exact types of field values that are serialized as is.
+ATOMIC_TYPES = frozenset({str, int, bool, NoneType})
 
 
 class ASTNode:
+    # Nodes only store their fields and the cached serialization.
+    __slots__ = ("_json",)
     SUBSTITUTIONS: ClassVar[dict[str, str]] = {"type": "type_"}
+    # Tag used when wrapping a node that is a member of a `Union`.
+    _WRAP: ClassVar[str]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._WRAP = cls.__name__
 
     def to_json(self) -> Any:
-        """Serialize for translation into Rust."""
-        annotations = inspect.get_annotations(type(self), eval_str=True)
-        attrs = (
-            (
-                # The attribute `type` is converted to `type_` for Rust compatibility.
-                self.SUBSTITUTIONS.get(attr, attr),
-                # Use the type annotations when converting attributes.
-                self.convert_to_json(getattr(self, attr), type_=annotations[attr]),
-            )
-            for attr in self.__match_args__
+        """Serialize for translation into Rust (the result is shared so must not be modified)."""
+        # Nodes are immutable so the result is cached.
+        try:
+            return self._json
+        except AttributeError:
+            # The frozen `__setattr__` rejects all assignments, so bypass it for the cache slot.
+            object.__setattr__(self, "_json", self._compute_json())
+            return self._json
+
+    @classmethod
+    @functools.cache
+    def json_fields(cls) -> tuple[tuple[str, str, Callable[[Any], Any]], ...]:
+        """Resolve the key, attribute name and converter of each field once per class."""
+        annotations = inspect.get_annotations(cls, eval_str=True)
+        return tuple(
+            # The attribute `type` is converted to `type_` for Rust compatibility.
+            (cls.SUBSTITUTIONS.get(attr, attr), attr, cls.json_converter(annotations[attr]))
+            for attr in cls.__match_args__
         )
-        return {key: value for key, value in attrs}
+
+    @classmethod
+    def json_converter(cls, type_: Type) -> Callable[[Any], Any]:
+        """Specialize `convert_to_json` for values annotated with `type_`."""
+        members = ASTNode.wrapped_types(type_)
+        if members:
+            return lambda value: (
+                value.wrapped_json() if type(value) in members else cls.convert_to_json(value)
+            )
+        elif typing.get_origin(type_) == Union:
+            # Optional nodes are not wrapped.
+            return lambda value: None if value is None else value.to_json()
+        elif typing.get_origin(type_) == tuple:
+            node_type = typing.get_args(type_)
+            if len(node_type) == 2 and node_type[1] is Ellipsis:
+                convert = cls.json_converter(node_type[0])
+                if convert is _identity:
+                    return list
+                return lambda value: [convert(node) for node in value]
+        elif isinstance(type_, type):
+            if issubclass(type_, ASTNode):
+                return lambda value: value.to_json()
+            if issubclass(type_, (Id, NoneType, int)):
+                return _identity
+        return functools.partial(cls.convert_to_json, type_=type_)
+
+    @staticmethod
+    @functools.cache
+    def wrapped_types(type_: Type) -> frozenset[Type]:
+        """Find the node types given an extra layer of wrapping when annotated as `type_`."""
+        if typing.get_origin(type_) != Union:
+            return frozenset()
+        members = frozenset(typing.get_args(type_)) - {NoneType}
+        # Add an extra layer of wrapping to `Union` types (but not `Optional` nodes).
+        return members if len(members) > 1 else frozenset()
+
+    def _compute_json(self) -> Any:
+        return {key: convert(getattr(self, attr)) for key, attr, convert in self.json_fields()}
+
+    def wrapped_json(self) -> dict[str, Any]:
+        """Serialize with an extra layer of wrapping that tags the node's type."""
+        return {self._WRAP: self.to_json()}
 
     @classmethod
     def convert_to_json(cls, value: Any, type_: Optional[Type] = None) -> Optional[Any]:
         value_type = type(value)
+        if value_type in ATOMIC_TYPES:
+            # Plain values need no conversion (or type introspection).
+            return value
         if type_ is None:
             type_ = value_type
         if isinstance(value, ASTNode):
-            if (
-                typing.get_origin(type_) == Union
-                and value_type in typing.get_args(type_)
-                and set(typing.get_args(type_)) != {NoneType, type(value)}
-            ):
-                # Add an extra layer of wrapping to `Union` types.
-                return {value_type.__name__: cls.convert_to_json(value, value_type)}
+            if value_type in ASTNode.wrapped_types(type_):
+                return value.wrapped_json()
             else:
                 return value.to_json()
-        elif isinstance(value, list):
+        elif isinstance(value, tuple):
             node_type = typing.get_args(type_)
-            if len(node_type) == 1:
-                # Use the object's type if known.
-                [type_] = node_type
+            if len(node_type) == 2 and node_type[1] is Ellipsis:
+                # Use the object's type if known (sequences are annotated as `tuple[T, ...]`).
+                [type_, _] = node_type
             else:
                 # Otherwise assume the default types are correct and infer at the next level.
                 type_ = None
             return [cls.convert_to_json(node, type_=type_) for node in value]
-        elif isinstance(value, (Id, NoneType, int)):
-            return value
+        raise TypeError(f"Cannot convert {value_type.__name__} to JSON")
+
+    @classmethod
+    @functools.cache
+    def sequence_fields(cls) -> tuple[str, ...]:
+        """Find the attributes annotated as sequences once per class."""
+        if issubclass(cls, enum.Enum):
+            return ()
+        annotations = inspect.get_annotations(cls.__init__)
+        return tuple(
+            key
+            for key in cls.__match_args__
+            if isinstance(annotations[key], str) and annotations[key].startswith("tuple")
+        )
 
     def __post_init__(self) -> None:
-        for key in self.__match_args__:
-            if isinstance(self, enum.Enum):
-                continue
-            annotation = inspect.get_annotations(self.__init__)[key]
+        for key in self.sequence_fields():
             value = getattr(self, key)
-            # Do a sanity check for any list items that are not lists.
-            if isinstance(annotation, str):
-                if annotation.startswith("list"):
-                    assert isinstance(value, list), f"{value} should be a list"
+            # Do a sanity check for any sequence items that are not sequences.
+            assert isinstance(value, (list, tuple)), f"{value} should be a sequence"
+            # Store sequences as tuples so that nodes are immutable
+            # (tuples are kept as is and empty sequences share the `()` singleton).
+            object.__setattr__(self, key, tuple(value))
 
 
 Id: TypeAlias = str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FunctionType(ASTNode):
-    argument_types: list[TypeInstance]
+    argument_types: tuple[TypeInstance, ...]
     return_type: TypeInstance
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GenericType(ASTNode):
     id: Id
-    type_variables: list[TypeInstance]
+    type_variables: tuple[TypeInstance, ...]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TupleType(ASTNode):
-    types: list[TypeInstance]
+    types: tuple[TypeInstance, ...]
 
 
-class AtomicTypeEnum(ASTNode, enum.IntEnum):
+class AtomicTypeEnum(ASTNode, enum.Enum):
     INT = enum.auto()
     BOOL = enum.auto()
 
-    def to_json(self) -> Any:
+    def _compute_json(self) -> Any:
         return self.name
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AtomicType(ASTNode):
     type: AtomicTypeEnum
     INT: ClassVar[AtomicType]
@@ -105,121 +179,133 @@ AtomicType.BOOL = AtomicType(AtomicTypeEnum.BOOL)
 TypeInstance: TypeAlias = Union[FunctionType, GenericType, TupleType, AtomicType]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TypeItem(ASTNode):
     id: Id
     type: Optional[TypeInstance]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UnionTypeDefinition(ASTNode):
     variable: GenericTypeVariable
-    items: list[TypeItem]
+    items: tuple[TypeItem, ...]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OpaqueTypeDefinition(ASTNode):
     variable: GenericTypeVariable
     type: TypeInstance
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmptyTypeDefinition(ASTNode):
     id: Id
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Assignee(ASTNode):
     id: Id
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ParametricAssignee(ASTNode):
     assignee: Assignee
-    generic_variables: list[Id]
+    generic_variables: tuple[Id, ...]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TypedAssignee(ASTNode):
     assignee: Assignee
     type: TypeInstance
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FunctionCall(ASTNode):
     function: Expression
-    arguments: list[Expression]
+    arguments: tuple[Expression, ...]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Integer(ASTNode):
     value: int
 
+    @classmethod
+    @functools.lru_cache(maxsize=256)
+    def literal(cls, value: int) -> Integer:
+        """Share the nodes of repeated literals (nodes are immutable so this is safe)."""
+        return cls(value)
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Boolean(ASTNode):
     value: bool
+    TRUE: ClassVar[Boolean]
+    FALSE: ClassVar[Boolean]
+
+
+Boolean.TRUE = Boolean(True)
+Boolean.FALSE = Boolean(False)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ElementAccess(ASTNode):
     expression: Expression
     index: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GenericVariable(ASTNode):
     id: Id
-    type_instances: list[TypeInstance]
+    type_instances: tuple[TypeInstance, ...]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class IfExpression(ASTNode):
     condition: Expression
     true_block: Block
     false_block: Block
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MatchItem(ASTNode):
     type_name: str
     assignee: Optional[Assignee]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MatchBlock(ASTNode):
-    matches: list[MatchItem]
+    matches: tuple[MatchItem, ...]
     block: Block
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MatchExpression(ASTNode):
     subject: Expression
-    blocks: list[MatchBlock]
+    blocks: tuple[MatchBlock, ...]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TupleExpression(ASTNode):
-    expressions: list[Expression]
+    expressions: tuple[Expression, ...]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FunctionDefinition(ASTNode):
-    parameters: list[TypedAssignee]
+    parameters: tuple[TypedAssignee, ...]
     return_type: TypeInstance
     body: Block
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GenericConstructor(ASTNode):
     id: Id
-    type_instances: list[TypeInstance]
+    type_instances: tuple[TypeInstance, ...]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ConstructorCall(ASTNode):
     constructor: GenericConstructor
-    arguments: list[Expression]
+    arguments: tuple[Expression, ...]
 
 
 Expression: TypeAlias = Union[
@@ -236,25 +322,25 @@ Expression: TypeAlias = Union[
 ]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Assignment(ASTNode):
     assignee: ParametricAssignee
     expression: Expression
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Block(ASTNode):
-    assignments: list[Assignment]
+    assignments: tuple[Assignment, ...]
     expression: Expression
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GenericTypeVariable(ASTNode):
     id: Id
-    generic_variables: list[Id]
+    generic_variables: tuple[Id, ...]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TransparentTypeDefinition(ASTNode):
     variable: GenericTypeVariable
     type: TypeInstance
@@ -269,22 +355,22 @@ Definition: TypeAlias = Union[
 ]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Program(ASTNode):
-    definitions: list[Definition]
+    definitions: tuple[Definition, ...]
 
 
 def Var(id: Id) -> GenericVariable:
-    return GenericVariable(id, [])
+    return GenericVariable(id, ())
 
 
 def Typename(id: Id) -> GenericType:
-    return GenericType(id, [])
+    return GenericType(id, ())
 
 
 def TypeVariable(id: Id) -> GenericTypeVariable:
-    return GenericTypeVariable(id, [])
+    return GenericTypeVariable(id, ())
 
 
 def Constructor(id: Id) -> GenericConstructor:
-    return GenericConstructor(id, [])
+    return GenericConstructor(id, ())
@@ -1,5 +1,7 @@
 import enum
 import re
+import sys
+from typing import ClassVar
 
 
 class Associativity(enum.IntEnum):
@@ -40,24 +42,44 @@ class OperatorManager:
 
     LEFT_ASSOCIATIVE_OPERATORS = {"$", "@", "::", "**", "++", "--"}
     NON_ASSOCIATIVE_OPERATORS = {"<", ">", "<=", ">=", "<=>", "==", "!="}
+    OPERATOR_ASSOCIATIVITY = {
+        **dict.fromkeys(LEFT_ASSOCIATIVE_OPERATORS, Associativity.LEFT),
+        **dict.fromkeys(NON_ASSOCIATIVE_OPERATORS, Associativity.NONE),
+    }
     OPERATOR_REGEX = r"^[&!+/\-^$<>@:*|%=.]+$"
+    OPERATOR_PATTERN = re.compile(OPERATOR_REGEX)
+
+    # Precedence and associativity of the known operators (so they skip the regex).
+    OPERATOR_INFO: ClassVar[dict[str, tuple[int, Associativity]]]
 
     @classmethod
     def check_operator(cls, operator: str) -> bool:
         """Returns whether `operator` could be a valid operator (grammatically)."""
-        return re.match(cls.OPERATOR_REGEX, operator) is not None
+        return cls.OPERATOR_PATTERN.match(operator) is not None
 
     @classmethod
     def get_precedence(cls, operator: str):
-        if not cls.check_operator(operator):
-            return -2
-        return cls.OPERATOR_PRECEDENCE.get(operator, -1)
+        info = cls.OPERATOR_INFO.get(operator)
+        if info is not None:
+            precedence, _ = info
+            return precedence
+        return -1 if cls.check_operator(operator) else -2
 
     @classmethod
     def get_associativity(cls, operator: str):
-        if operator in cls.LEFT_ASSOCIATIVE_OPERATORS or not cls.check_operator(operator):
-            return Associativity.LEFT
-        elif operator in cls.NON_ASSOCIATIVE_OPERATORS:
-            return Associativity.NONE
-        else:
-            return Associativity.RIGHT
+        info = cls.OPERATOR_INFO.get(operator)
+        if info is not None:
+            _, associativity = info
+            return associativity
+        return Associativity.RIGHT if cls.check_operator(operator) else Associativity.LEFT
+
+
+# Known operators are right-associative unless specified otherwise.
+OperatorManager.OPERATOR_INFO = {
+    # Parsed operators are interned so lookups can match on identity.
+    sys.intern(operator): (
+        precedence,
+        OperatorManager.OPERATOR_ASSOCIATIVITY.get(operator, Associativity.RIGHT),
+    )
+    for operator, precedence in OperatorManager.OPERATOR_PRECEDENCE.items()
+}
@@ -1,3 +1,4 @@
+import itertools
 from parser import Parser
 
 import pytest
@@ -86,22 +87,13 @@ def test_parsing_invalid_operator():
     assert ast == None
 
 
-@pytest.mark.parametrize(
-    "operator,precedence",
-    ((operator, precedence) for operator, associativity, precedence in operators),
-)
-def test_precedence(operator, precedence):
-    operator1, precedence1 = operator, precedence
-    for operator2, _, precedence2 in operators:
-        if operator1 == operator2:
-            assert OperatorManager.get_precedence(operator1) == OperatorManager.get_precedence(
-                operator2
-            )
-        elif precedence1 < precedence2:
-            assert OperatorManager.get_precedence(operator1) < OperatorManager.get_precedence(
-                operator2
-            )
-        elif precedence1 > precedence2:
-            assert OperatorManager.get_precedence(operator1) > OperatorManager.get_precedence(
-                operator2
-            )
+def test_precedence():
+    # Group the operators by precedence (the order within a group is not checked).
+    groups = [
+        [OperatorManager.get_precedence(operator) for operator, _, _ in group]
+        for _, group in itertools.groupby(
+            sorted(operators, key=lambda operator: operator[2]), key=lambda operator: operator[2]
+        )
+    ]
+    for lower, higher in zip(groups, groups[1:]):
+        assert max(lower) < min(higher)
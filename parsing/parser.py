@@ -1,5 +1,6 @@
 import re
-from typing import Optional
+import sys
+from typing import ClassVar, Optional
 
 from antlr4 import CommonTokenStream, InputStream, ParserRuleContext, Token
 from ast_nodes import (
@@ -7,7 +8,6 @@ from ast_nodes import (
     Assignment,
     ASTNode,
     AtomicType,
-    AtomicTypeEnum,
     Block,
     Boolean,
     ConstructorCall,
@@ -48,23 +48,28 @@ from operators import Associativity, OperatorManager
 class VisitorError(Exception): ...
 
 
+# Operators written as identifiers (`__op__`).
+OPERATOR_ID_PATTERN = re.compile(r"^__(\S+)__$")
+
+
 class Visitor(GrammarVisitor):
     def visitList(self, ctx: ParserRuleContext) -> list:
         """Utility to visit a list of parse nodes (no type specified)."""
-        children = (self.visit(child) for child in ctx.getChildren())
-        return [child for child in children if child is not None]
+        return [result for child in ctx.getChildren() if (result := self.visit(child)) is not None]
 
     def visitId(self, ctx: GrammarParser.IdContext) -> str:
-        return ctx.getText()
+        # Names repeat throughout a program, so share a single copy of each.
+        return sys.intern(ctx.getText())
 
     def visitOperator_id(self, ctx) -> str:
-        return re.match(r"^__(\S+)__$", ctx.getText()).group(1)
+        return sys.intern(OPERATOR_ID_PATTERN.match(ctx.getText()).group(1))
 
     def visitAtomic_type(self, ctx: GrammarParser.Atomic_typeContext) -> AtomicType:
-        type_name = ctx.getText().upper()
-        # Convert to `AtomicTypeEnum`
-        type = AtomicTypeEnum[type_name]
-        return AtomicType(type)
+        # Atomic types are shared, so select them using the token type.
+        if ctx.start.type == GrammarParser.INT:
+            return AtomicType.INT
+        else:
+            return AtomicType.BOOL
 
     def visitType_instance(self, ctx: GrammarParser.Type_instanceContext) -> TypeInstance:
         if ctx.type_instance() is not None:
@@ -83,9 +88,9 @@ class Visitor(GrammarVisitor):
     def visitGeneric_instance(self, ctx: GrammarParser.Generic_instanceContext) -> GenericVariable:
         if ctx.operator_id() is not None:
             id = self.visit(ctx.operator_id())
-            return GenericVariable(id, [])
+            return GenericVariable(id, ())
         id = self.visitId(ctx.id_())
-        generic_list = [] if ctx.generic_list() is None else self.visit(ctx.generic_list())
+        generic_list = () if ctx.generic_list() is None else self.visit(ctx.generic_list())
         return GenericVariable(id, generic_list)
 
     def visitType_list(self, ctx: GrammarParser.Type_listContext) -> list[TypeInstance]:
@@ -98,7 +103,7 @@ class Visitor(GrammarVisitor):
         if ctx.return_type() is not None:
             return_type = self.visit(ctx.return_type())
             if isinstance(return_type, TupleType):
-                return return_type.types
+                return list(return_type.types)
             else:
                 return [return_type]
         else:
@@ -111,13 +116,13 @@ class Visitor(GrammarVisitor):
 
     def visitInteger(self, ctx: GrammarParser.IntegerContext) -> Integer:
         value = int(ctx.getText())
-        return Integer(value)
+        return Integer.literal(value)
 
     def visitBoolean(self, ctx: GrammarParser.BooleanContext) -> Boolean:
-        if ctx.getText().lower() == "true":
-            return Boolean(True)
+        if ctx.start.type == GrammarParser.TRUE:
+            return Boolean.TRUE
         else:
-            return Boolean(False)
+            return Boolean.FALSE
 
     def visitNon_singleton_expr_list(
         self, ctx: GrammarParser.Non_singleton_expr_listContext
@@ -135,11 +140,12 @@ class Visitor(GrammarVisitor):
         return TupleExpression(expressions)
 
     def visitInfix_operator(self, ctx: GrammarParser.Infix_operatorContext) -> str:
-        operator = ctx.getText().strip()
-        match = re.match(r"^__(\S+)__$", ctx.getText())
+        text = ctx.getText()
+        operator = text.strip()
+        match = OPERATOR_ID_PATTERN.match(text)
         if match:
             operator = match.group(1)
-        return operator
+        return sys.intern(operator)
 
     def visitInfix_free_expr(self, ctx: GrammarParser.Infix_free_exprContext) -> Expression:
         if ctx.fn_call_free_expr() is None:
@@ -147,48 +153,53 @@ class Visitor(GrammarVisitor):
         else:
             return self.visit(ctx.fn_call_free_expr())
 
-    def visitInfix_call(self, ctx: GrammarParser.Infix_callContext, carry=None) -> FunctionCall:
-        if carry is None:
-            # Use a variable (highest precedence) as root (will eventually be ignored).
-            carry = ("id", lambda x: x)
+    def flatten_infix(
+        self, ctx: GrammarParser.Infix_callContext
+    ) -> tuple[list[Expression], list[str]]:
+        """Collect the operands and operators of a chain of infix calls (left to right)."""
+        operands, operators = [], []
+        while ctx is not None:
+            operands.append(self.visit(ctx.infix_free_expr()))
+            operators.append(self.visit(ctx.infix_operator()))
+            expr = ctx.expr()
+            ctx = expr.infix_call()
+        operands.append(self.visit(expr))
+        return operands, operators
 
-        left = self.visit(ctx.infix_free_expr())
-        operator = self.visit(ctx.infix_operator())
-
-        parent_operator, tree = carry
-        if (
-            operator == parent_operator
-            and OperatorManager.get_associativity(operator) == Associativity.NONE
-        ):
-            raise VisitorError(f"{operator} is non-associative")
-
-        if OperatorManager.get_precedence(parent_operator) < OperatorManager.get_precedence(
-            operator
-        ) or (
-            operator == parent_operator
-            and OperatorManager.get_associativity(operator) == Associativity.RIGHT
-        ):
-            # This operator has higher precedence, so make it the root of the new tree
-            # and rotate the left subtree.
-            carry = (
-                operator,
-                lambda x: FunctionCall(GenericVariable(operator, []), [tree(left), x]),
-            )
-        else:
-            # This operator has lower precedence, so keep the parent as the root
-            # and place at the base with the next argument.
-            carry = (
-                parent_operator,
-                lambda x: tree(FunctionCall(GenericVariable(operator, []), [left, x])),
-            )
-        if ctx.expr().infix_call() is None:
-            _, function = carry
-            # Use the right node as the second argument.
-            right = self.visit(ctx.expr())
-            return function(right)
-        else:
-            # Continue parsing in the right subtree.
-            return self.visitInfix_call(ctx.expr().infix_call(), carry=carry)
+    @staticmethod
+    def fold_infix(spine: list[tuple[str, Expression]], right: Expression) -> Expression:
+        """Fill the open right argument at the base of `spine` and build the tree upwards."""
+        for operator, left in reversed(spine):
+            right = FunctionCall(GenericVariable(operator, ()), [left, right])
+        return right
+
+    def visitInfix_call(self, ctx: GrammarParser.Infix_callContext) -> FunctionCall:
+        operands, operators = self.flatten_infix(ctx)
+        # Use a variable (highest precedence) as root (will eventually be ignored).
+        root = "id"
+        # Operators (with their left arguments) from the root down to the open right argument.
+        spine = []
+        for left, operator in zip(operands, operators):
+            if (
+                operator == root
+                and OperatorManager.get_associativity(operator) == Associativity.NONE
+            ):
+                raise VisitorError(f"{operator} is non-associative")
+
+            if OperatorManager.get_precedence(root) < OperatorManager.get_precedence(operator) or (
+                operator == root
+                and OperatorManager.get_associativity(operator) == Associativity.RIGHT
+            ):
+                # This operator has higher precedence, so make it the root of the new tree
+                # and rotate the left subtree.
+                root = operator
+                spine = [(operator, self.fold_infix(spine, left))]
+            else:
+                # This operator has lower precedence, so keep the parent as the root
+                # and place at the base with the next argument.
+                spine.append((operator, left))
+        # Use the right node as the second argument.
+        return self.fold_infix(spine, operands[-1])
 
     def visitPrefix_call(self, ctx: GrammarParser.Prefix_callContext) -> FunctionCall:
         operator = self.visit(ctx.infix_operator())
@@ -199,16 +210,20 @@ class Visitor(GrammarVisitor):
 
     def visitFn_call(self, ctx: GrammarParser.Fn_callContext) -> FunctionCall:
         function = self.visit(ctx.fn_call_head())
-        return self.visitFn_call_tail(ctx.fn_call_tail(), function=function)
+        tail = ctx.fn_call_tail()
+        while tail is not None:
+            function = FunctionCall(function, self.visit(tail.expr_list()))
+            tail = tail.fn_call_tail()
+        return function
 
     def visitAccess_tail(
         self, ctx: GrammarParser.Access_tailContext, expression=None
     ) -> ElementAccess:
-        index = int(ctx.UINT().getText())
-        access = ElementAccess(expression, index)
-        if ctx.access_tail() is None:
-            return access
-        return self.visitAccess_tail(ctx.access_tail(), expression=access)
+        while ctx is not None:
+            index = int(ctx.UINT().getText())
+            expression = ElementAccess(expression, index)
+            ctx = ctx.access_tail()
+        return expression
 
     def visitAccess(self, ctx: GrammarParser.AccessContext):
         expression = self.visit(ctx.access_head())
@@ -221,35 +236,26 @@ class Visitor(GrammarVisitor):
             return self.visit(ctx.expr())
         return super().visitFn_call_free_expr(ctx)
 
-    def visitFn_call_tail(
-        self, ctx: GrammarParser.Fn_call_tailContext, function=None
-    ) -> FunctionCall:
-        args = self.visit(ctx.expr_list())
-        function = FunctionCall(function, args)
-        if ctx.fn_call_tail() is not None:
-            return self.visitFn_call_tail(ctx.fn_call_tail(), function)
-        return function
-
     def visitId_list(self, ctx: GrammarParser.Id_listContext) -> list[str]:
         return self.visitList(ctx)
 
     def visitNon_generic_assignee(self, ctx: GrammarParser.Non_generic_assigneeContext) -> Assignee:
-        return Assignee(ctx.getText())
+        return Assignee(sys.intern(ctx.getText()))
 
     def visitGeneric_assignee(
         self, ctx: GrammarParser.Generic_assigneeContext
     ) -> ParametricAssignee:
         id = self.visit(ctx.non_generic_assignee())
-        generics = [] if ctx.id_list() is None else self.visit(ctx.id_list())
+        generics = () if ctx.id_list() is None else self.visit(ctx.id_list())
         return ParametricAssignee(id, generics)
 
     def visitAssignee(self, ctx: GrammarParser.AssigneeContext) -> ParametricAssignee:
         if ctx.operator_id() is not None:
             id = self.visit(ctx.operator_id())
-            return ParametricAssignee(Assignee(id), [])
+            return ParametricAssignee(Assignee(id), ())
         elif ctx.getText() == "__":
             # Handle edge case of the variable `__`.
-            return ParametricAssignee(Assignee("__"), [])
+            return ParametricAssignee(Assignee("__"), ())
         return super().visit(ctx.generic_assignee())
 
     def visitAssignment(self, ctx: GrammarParser.AssignmentContext) -> Assignment:
@@ -346,7 +352,7 @@ class Visitor(GrammarVisitor):
             type_instance = self.visit(ctx.type_instance())
             return OpaqueTypeDefinition(type_variable, type_instance)
         elif ctx.empty_def() is not None:
-            if type_variable.generic_variables != []:
+            if type_variable.generic_variables:
                 raise VisitorError(
                     f"Invalid empty type with generics {type_variable.generic_variables}"
                 )
@@ -369,21 +375,24 @@ class Visitor(GrammarVisitor):
 
 
 class Parser:
+    # The visitor holds no state, so it is shared between calls.
+    VISITOR: ClassVar[Visitor] = Visitor()
+    RULE_NAMES: ClassVar[frozenset[str]] = frozenset(GrammarParser.ruleNames)
+
     @staticmethod
     def parse(code: str, target: str) -> Optional[ASTNode]:
-        input_stream = InputStream(code)
-        lexer = GrammarLexer(input_stream)
-        stream = CommonTokenStream(lexer)
-        parser = GrammarParser(stream)
-        if target in parser.ruleNames:
+        if target in Parser.RULE_NAMES:
+            input_stream = InputStream(code)
+            lexer = GrammarLexer(input_stream)
+            stream = CommonTokenStream(lexer)
+            parser = GrammarParser(stream)
             tree = getattr(parser, target).__call__()
             # Require no errors and at the end of the file.
             if parser.getNumberOfSyntaxErrors() > 0 or stream.LA(1) != Token.EOF:
                 return None
-            visitor = Visitor()
             try:
                 # Fail if there are any errors converting parse tree to AST.
-                return visitor.visit(tree)
+                return Parser.VISITOR.visit(tree)
             except VisitorError:
                 return None
         return None
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from parser import Parser
 from typing import Optional
 
@@ -423,6 +425,22 @@ from ast_nodes import (
             ),
             "expr",
         ),
+        (
+            "a - b + c",
+            FunctionCall(
+                Var("-"),
+                [Var("a"), FunctionCall(Var("+"), [Var("b"), Var("c")])],
+            ),
+            "expr",
+        ),
+        (
+            "a + b - c",
+            FunctionCall(
+                Var("+"),
+                [Var("a"), FunctionCall(Var("-"), [Var("b"), Var("c")])],
+            ),
+            "expr",
+        ),
         (
             "g $ h(x)",
             FunctionCall(
@@ -504,6 +522,33 @@ from ast_nodes import (
             None,
             "expr",
         ),
+        (
+            "0 == 1 < 2",
+            FunctionCall(
+                Var("=="),
+                [Integer(0), FunctionCall(Var("<"), [Integer(1), Integer(2)])],
+            ),
+            "expr",
+        ),
+        (
+            "0 == 1 < 2 == 3",
+            None,
+            "expr",
+        ),
+        (
+            "1 $ 2 == 3 == 4",
+            FunctionCall(
+                Var("$"),
+                [
+                    Integer(1),
+                    FunctionCall(
+                        Var("=="),
+                        [Integer(2), FunctionCall(Var("=="), [Integer(3), Integer(4)])],
+                    ),
+                ],
+            ),
+            "expr",
+        ),
         (
             "(3 == 4) == (5 == 6)",
             FunctionCall(
@@ -8,7 +8,8 @@ gc.disable()
 program_name = sys.argv[1]
 args = sys.argv[2]
 
-args = map(int, args.strip().split())
+# Parse the arguments up front so that it is not timed with `main`.
+args = [int(arg) for arg in args.split()]
 
 
 def handler():
@@ -21,18 +22,18 @@ sys.setrecursionlimit(10000)
 # Set handler if the program timeouts.
 signal.signal(signal.SIGALRM, handler)
 
-with open(program_name) as f:
-    # Define `main` and related functions.
-    exec(f.read())
+with open(program_name, "rb") as f:
+    # Define `main` and related functions (compiling from bytes skips text decoding).
+    exec(compile(f.read(), program_name, "exec"))
 
 try:
     # Timeout after 60s.
     signal.alarm(60)
-    start_time = time.time()
+    start_time = time.perf_counter_ns()
     main(*args)
-    end_time = time.time()
+    end_time = time.perf_counter_ns()
     signal.alarm(0)
     # Print time in nanoseconds.
-    print(int((end_time - start_time) * 10**9))
+    print(end_time - start_time)
 except Exception as e:
     print("nan")
@@ -11,20 +11,15 @@ import plotly.io as pio
 pio.kaleido.scope.mathjax = None
 
 
-def convert_float_or_nan(x: str) -> float:
-    try:
-        return float(x)
-    except ValueError:
-        return float("nan")
-
-
 def load_directory(directory: str) -> pd.DataFrame:
     log_filename = os.path.join(directory, "log.tsv")
     title_filename = os.path.join(directory, "title.txt")
 
     df = pd.read_csv(
-        log_filename, sep="\t", index_col=False, converters={"duration": convert_float_or_nan}
+        log_filename, sep="\t", index_col=False, dtype={"name": str, "args": str, "duration": str}
     )
+    # Failed runs have non-numeric durations, which become `nan`.
+    df["duration"] = pd.to_numeric(df.duration, errors="coerce").astype(float)
     # Write function as though it is a function call.
     df["function"] = df.name + "(" + df.args + ")"
 
@@ -41,11 +36,9 @@ def merge_logs(*logs: pd.DataFrame) -> pd.DataFrame:
 
 def normalize(df: pd.DataFrame) -> pd.DataFrame:
     """Normalize by dividing by the geometric mean of timings fo r a given function."""
-    df["log_duration"] = np.log10(df.duration)
-    grouped_df = df.groupby("function").log_duration
-    mean = grouped_df.transform("mean")
-    df["normalized_performance"] = 10 ** (mean - df.log_duration)
-    del df["log_duration"]
+    # Group once (without sorting the groups) and keep the logs out of the frame.
+    log_mean = np.log(df.duration).groupby(df.function, sort=False).transform("mean")
+    df["normalized_performance"] = np.exp(log_mean) / df.duration
     return df
 
 
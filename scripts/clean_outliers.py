@@ -1,5 +1,4 @@
 import argparse
-import functools
 import os.path
 
 import numpy as np
@@ -12,22 +11,41 @@ def load_data(directory: str) -> pd.DataFrame:
     return df.dropna(how="any", axis=0, ignore_index=True)
 
 
-def remove_outliers_iteration(df: pd.DataFrame, threshold: float) -> pd.DataFrame:
-    """Remove timings more than `threshold` times the standard deviation outside the mean for a sample program."""
-    mean = df.groupby("sample").time.transform("mean")
-    std = df.groupby("sample").time.transform(functools.partial(np.nanstd, ddof=0))
-    z = np.abs(df.time - mean) / std
-    return df.loc[z < threshold].reset_index(drop=True)
+def remove_outliers_iteration(
+    samples: np.ndarray, times: np.ndarray, keep: np.ndarray, threshold: float
+) -> np.ndarray:
+    """Keep timings less than `threshold` times the standard deviation outside the mean for a sample program.
+
+    `samples` are integer codes for the sample programs and `keep` masks the timings still in use.
+    """
+    num_samples = samples.max(initial=-1) + 1
+    count = np.bincount(samples, weights=keep, minlength=num_samples)
+    total = np.bincount(samples, weights=np.where(keep, times, 0.0), minlength=num_samples)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = total / count
+        # Compute the spread from the deviations (rather than the squares) for numerical stability.
+        deviation = np.where(keep, times - mean[samples], 0.0)
+        std = np.sqrt(np.bincount(samples, weights=deviation**2, minlength=num_samples) / count)
+        z = np.abs(times - mean[samples]) / std[samples]
+    return keep & (z < threshold)
 
 
 def remove_outliers(df: pd.DataFrame, threshold: float) -> pd.DataFrame:
     """Remove outliers iteratively until there are no updates."""
-    length = None
-    while length is None or length != len(df):
-        length = len(df)
-        df = remove_outliers_iteration(df, threshold)
-
-    return df
+    # Group the samples once then update a mask.
+    samples, _ = pd.factorize(df["sample"], sort=False)
+    times = df.time.to_numpy(dtype=float)
+    keep = np.ones(len(df), dtype=bool)
+    length = len(df)
+    while True:
+        keep = remove_outliers_iteration(samples, times, keep, threshold)
+        # Timings are only ever removed, so there are no updates when the count is unchanged.
+        remaining = np.count_nonzero(keep)
+        if remaining == length:
+            break
+        length = remaining
+
+    return df.loc[keep].reset_index(drop=True)
 
 
 def save_data(df: pd.DataFrame, directory: str) -> None:
@@ -20,12 +20,10 @@ def load_data(filename: str) -> pd.DataFrame:
 
 def group_data(df: pd.DataFrame, groups: list[list[str]]) -> pd.DataFrame:
     """Group similar coefficients into the same "bin" for fitting."""
-    df = df.copy()
-    for i, group in enumerate(groups):
-        combined_values = df[group].sum(axis=1)
-        df[str(i)] = combined_values
-        df.drop(group, axis=1, inplace=True)
-    return df
+    # Sum each group then build the result in one go (rather than dropping a group at a time).
+    combined_values = {str(i): df[group].sum(axis=1) for i, group in enumerate(groups)}
+    ungrouped_df = df.drop([column for group in groups for column in group], axis=1)
+    return pd.concat([ungrouped_df, pd.DataFrame(combined_values, index=df.index)], axis=1)
 
 
 def fit(df: pd.DataFrame) -> dict[str, float]:
@@ -1,6 +1,7 @@
 import argparse
 import json
 
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
@@ -35,16 +36,12 @@ def main(args: argparse.Namespace):
     if json_filename is not None:
         with open(json_filename) as f:
             coefficients = json.load(f)
-        unique_samples = pd.unique(df["sample"])
-
-        predicted_times = []
-
-        for sample in unique_samples:
-            example = df.loc[df["sample"] == sample].iloc[0]
-            predicted_time = coefficients["_constant"] + sum(
-                example[k] * v for k, v in coefficients.items() if k != "_constant"
-            )
-            predicted_times.append(predicted_time)
+        features = [k for k in coefficients if k != "_constant"]
+        weights = np.array([coefficients[k] for k in features])
+        # Predict each sample's time from its first example.
+        examples = df.drop_duplicates(subset="sample")
+        unique_samples = examples["sample"].to_numpy()
+        predicted_times = coefficients["_constant"] + examples[features].to_numpy() @ weights
 
         fig.add_trace(
             go.Scatter(